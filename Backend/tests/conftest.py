@@ -0,0 +1,5 @@
+import os
+import sys
+
+# Tests run from Backend/ (pytest tests/); make working_server importable
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
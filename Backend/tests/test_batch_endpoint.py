@@ -0,0 +1,43 @@
+import pytest
+from fastapi.testclient import TestClient
+
+from working_server import MAX_BATCH_SIZE, app
+
+client = TestClient(app)
+
+
+def test_batch_returns_each_requested_payload():
+    response = client.post("/api/v1/batch", json={"requests": ["analytics", "campaigns", "analytics"]})
+    assert response.status_code == 200
+    body = response.json()
+    assert body["success"] is True
+    assert list(body["results"]) == ["analytics", "campaigns"]
+    batched = body["results"]["analytics"]
+    direct = client.get("/api/v1/analytics").json()
+    batched.pop("generated_at", None)
+    direct.pop("generated_at", None)
+    assert batched == direct
+
+
+def test_unknown_name_gets_its_own_error_entry():
+    body = client.post("/api/v1/batch", json={"requests": ["analytics", "nope"]}).json()
+    assert body["success"] is True
+    assert body["results"]["analytics"]["success"] is True
+    assert body["results"]["nope"] == {"success": False, "error": "Unknown request"}
+
+
+@pytest.mark.parametrize("requested", ["analytics", {"analytics": 1}, ["analytics", 3], [None]])
+def test_requests_must_be_a_list_of_strings(requested):
+    response = client.post("/api/v1/batch", json={"requests": requested})
+    assert response.status_code == 400
+    assert response.json()["success"] is False
+
+
+def test_batch_size_is_capped():
+    names = ["name%d" % n for n in range(MAX_BATCH_SIZE + 1)]
+    assert client.post("/api/v1/batch", json={"requests": names}).status_code == 400
+
+
+def test_invalid_json_body():
+    response = client.post("/api/v1/batch", content=b"{not json", headers={"Content-Type": "application/json"})
+    assert response.status_code == 400
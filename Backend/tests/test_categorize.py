@@ -0,0 +1,72 @@
+import pytest
+
+from working_server import _CONTENT_TEMPLATES, _categorize
+
+# Topics and the content category the original substring classifier gave them
+# (any(keyword in topic.lower()) per category, in ai/business/leadership/
+# technology order). Whole-word matching must not send any of them elsewhere.
+SUBSTRING_CLASSIFIER_RESULTS = [
+    ("AI in Healthcare", "ai"),
+    ("GenAI adoption", "ai"),
+    ("OpenAI news", "ai"),
+    ("Machine Learning", "ai"),
+    ("Machine-learning", "ai"),
+    ("Machines at work", "ai"),
+    ("Automation at scale", "ai"),
+    ("Artificial intelligence ethics", "ai"),
+    ("Business strategy", "business"),
+    ("Business strategies", "business"),
+    ("Small businesses", "business"),
+    ("Growth hacking", "business"),
+    ("Career growth", "business"),
+    ("Market trends", "business"),
+    ("E-commerce markets", "business"),
+    ("Marketplaces", "business"),
+    ("Product-market fit", "business"),
+    ("Marketing 101", "business"),
+    ("Digital marketing", "business"),
+    ("Content strategy", "business"),
+    ("Sales enablement", "business"),
+    ("Salesforce tips", "business"),
+    ("Salespeople", "business"),
+    ("Leadership lessons", "leadership"),
+    ("Project management", "leadership"),
+    ("Time management", "leadership"),
+    ("Team culture", "leadership"),
+    ("Teams and teamwork", "leadership"),
+    ("Teambuilding", "leadership"),
+    ("Team-building", "leadership"),
+    ("Teammates", "leadership"),
+    ("Company culture", "leadership"),
+    ("Tech trends", "technology"),
+    ("Fintech trends", "technology"),
+    ("EdTech", "technology"),
+    ("Technical debt", "technology"),
+    ("Technologist", "technology"),
+    ("Technology adoption", "technology"),
+    ("Healthcare technologies", "technology"),
+    ("Digital transformation", "technology"),
+    ("Digitalization", "technology"),
+    ("Software engineering", "technology"),
+    ("Data science", "technology"),
+    ("Data-driven decisions", "technology"),
+    ("Databases", "technology"),
+    ("Datasets", "technology"),
+    ("Cloud computing", "default"),
+    ("Remote work", "default"),
+    ("Networking tips", "default"),
+    ("Startups", "default"),
+    ("Cybersecurity", "default"),
+    ("Public speaking", "default"),
+]
+
+# Deliberate differences: "ai" no longer matches inside other words
+WHOLE_WORD_CHANGES = [
+    ("Maintenance planning", "default"),
+    ("Email campaigns", "default"),
+]
+
+
+@pytest.mark.parametrize("topic,category", SUBSTRING_CLASSIFIER_RESULTS + WHOLE_WORD_CHANGES)
+def test_topic_gets_the_same_content_template(topic, category):
+    assert _CONTENT_TEMPLATES[_categorize(topic.lower())] is _CONTENT_TEMPLATES[category]
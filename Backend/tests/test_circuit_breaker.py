@@ -0,0 +1,94 @@
+import asyncio
+
+import pytest
+
+import working_server
+from working_server import CircuitBreaker, fallback_content, generate_with_fallback
+
+
+@pytest.fixture
+def breaker(monkeypatch):
+    breaker = CircuitBreaker(fail_max=2, reset_timeout=30)
+    monkeypatch.setattr(working_server, "content_breaker", breaker)
+    monkeypatch.setattr(working_server, "_last_good_content", working_server.OrderedDict())
+    return breaker
+
+
+def failing_generator(monkeypatch, topics=("down",)):
+    calls = []
+    generate = working_server._generate_content
+
+    async def fake(topic):
+        calls.append(topic)
+        if topic in topics:
+            raise RuntimeError("upstream down")
+        return await generate(topic)
+
+    monkeypatch.setattr(working_server, "_generate_content", fake)
+    return calls
+
+
+def test_opens_after_fail_max_consecutive_failures():
+    breaker = CircuitBreaker(fail_max=2, reset_timeout=30)
+    breaker.record_failure()
+    breaker.record_success()
+    breaker.record_failure()
+    assert breaker.allow()
+    breaker.record_failure()
+    assert not breaker.allow()
+
+
+def test_half_open_after_reset_timeout(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(working_server.time, "monotonic", lambda: now[0])
+    breaker = CircuitBreaker(fail_max=3, reset_timeout=30)
+    for _ in range(3):
+        breaker.record_failure()
+    assert not breaker.allow()
+    now[0] += 31
+    assert breaker.allow()
+    # A single failure while half-open re-opens it
+    breaker.record_failure()
+    assert not breaker.allow()
+
+
+def test_one_failed_generation_counts_once_for_all_waiting_callers(breaker, monkeypatch):
+    calls = failing_generator(monkeypatch)
+
+    async def main():
+        return await asyncio.gather(*(generate_with_fallback("down") for _ in range(5)))
+
+    results = asyncio.run(main())
+    assert calls == ["down"]
+    assert all(stale for _, stale in results)
+    # fail_max is 2: a single upstream error must not have opened the breaker
+    assert breaker.allow()
+    result, stale = asyncio.run(generate_with_fallback("AI in Healthcare"))
+    assert not stale
+
+
+def test_timeout_counts_as_failure(breaker, monkeypatch):
+    async def slow(topic):
+        await asyncio.sleep(1)
+
+    monkeypatch.setattr(working_server, "_generate_content", slow)
+    monkeypatch.setattr(working_server, "CONTENT_TIMEOUT_SECONDS", 0.01)
+    for _ in range(2):
+        assert asyncio.run(generate_with_fallback("slow"))[1]
+    assert not breaker.allow()
+
+
+def test_open_breaker_skips_generation(breaker, monkeypatch):
+    calls = failing_generator(monkeypatch, topics=())
+    breaker.record_failure()
+    breaker.record_failure()
+    result, stale = asyncio.run(generate_with_fallback("Team culture"))
+    assert stale and calls == []
+
+
+def test_fallback_prefers_the_topics_last_good_content(breaker, monkeypatch):
+    good, _ = asyncio.run(generate_with_fallback("Team culture"))
+    failing_generator(monkeypatch, topics=("Team culture",))
+    result, stale = asyncio.run(generate_with_fallback("Team culture"))
+    assert stale and result == good
+    assert fallback_content("Never generated")["text"].startswith("🌟 Professional Growth Through Never generated")
@@ -0,0 +1,42 @@
+from email.utils import formatdate
+
+from starlette.requests import Request
+
+from working_server import STATIC_LAST_MODIFIED_AT, _etag_for, _not_modified
+
+ETAG = _etag_for(b'{"success":true}')
+
+
+def request_with(**headers):
+    return Request({
+        "type": "http",
+        "headers": [(name.replace("_", "-").encode(), value.encode()) for name, value in headers.items()],
+    })
+
+
+def test_etag_is_weak():
+    assert ETAG.startswith('W/"')
+
+
+def test_no_validators():
+    assert not _not_modified(request_with(), ETAG)
+
+
+def test_if_none_match_compares_weakly():
+    opaque = ETAG[2:]
+    assert _not_modified(request_with(if_none_match=ETAG), ETAG)
+    assert _not_modified(request_with(if_none_match=opaque), ETAG)
+    assert _not_modified(request_with(if_none_match='"other", ' + ETAG), ETAG)
+    assert _not_modified(request_with(if_none_match="*"), ETAG)
+    assert not _not_modified(request_with(if_none_match='W/"other"'), ETAG)
+
+
+def test_if_modified_since():
+    assert _not_modified(request_with(if_modified_since=formatdate(STATIC_LAST_MODIFIED_AT, usegmt=True)), ETAG)
+    assert not _not_modified(request_with(if_modified_since=formatdate(STATIC_LAST_MODIFIED_AT - 60, usegmt=True)), ETAG)
+    assert not _not_modified(request_with(if_modified_since="not a date"), ETAG)
+
+
+def test_if_none_match_wins_over_if_modified_since():
+    fresh = formatdate(STATIC_LAST_MODIFIED_AT, usegmt=True)
+    assert not _not_modified(request_with(if_none_match='"other"', if_modified_since=fresh), ETAG)
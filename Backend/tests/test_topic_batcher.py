@@ -0,0 +1,128 @@
+import asyncio
+
+import pytest
+
+from working_server import BatchQueueFull, TopicBatcher, generate_professional_content_batch
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+def each(generate):
+    """Batch generator running an async per-topic generator concurrently"""
+    async def generate_batch(topics):
+        return await asyncio.gather(*(generate(topic) for topic in topics), return_exceptions=True)
+    return generate_batch
+
+
+def test_distinct_topics_go_to_one_batch_call():
+    batches = []
+
+    async def generate_batch(topics):
+        batches.append(topics)
+        return [topic.upper() for topic in topics]
+
+    async def main():
+        batcher = TopicBatcher(generate_batch, window_ms=5)
+        return await asyncio.gather(*(batcher.submit("ai") for _ in range(5)), batcher.submit("sales"))
+
+    assert run(main()) == ["AI"] * 5 + ["SALES"]
+    assert batches == [["ai", "sales"]]
+
+
+def test_distinct_topics_are_generated_concurrently():
+    started = []
+    release = None
+
+    async def generate(topic):
+        started.append(topic)
+        await release.wait()
+        return topic
+
+    async def main():
+        nonlocal release
+        release = asyncio.Event()
+        batcher = TopicBatcher(each(generate))
+        waiting = asyncio.gather(batcher.submit("a"), batcher.submit("b"), batcher.submit("c"))
+        # Every topic starts before any of them finishes
+        while len(started) < 3:
+            await asyncio.sleep(0)
+        release.set()
+        return await waiting
+
+    assert run(main()) == ["a", "b", "c"]
+
+
+def test_slow_generator_does_not_block_the_loop():
+    async def generate(topic):
+        await asyncio.sleep(1)
+        return topic
+
+    async def main():
+        batcher = TopicBatcher(each(generate))
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(batcher.submit("slow"), timeout=0.05)
+
+    run(main())
+
+
+def test_error_is_fanned_out_to_every_caller_of_that_topic_only():
+    async def generate(topic):
+        if topic == "bad":
+            raise RuntimeError("upstream down")
+        return topic
+
+    async def main():
+        batcher = TopicBatcher(each(generate))
+        return await asyncio.gather(batcher.submit("bad"), batcher.submit("bad"), batcher.submit("good"),
+                                    return_exceptions=True)
+
+    bad1, bad2, good = run(main())
+    assert isinstance(bad1, RuntimeError) and bad1 is bad2
+    assert good == "good"
+
+
+def test_failed_batch_call_fails_every_caller():
+    async def generate_batch(topics):
+        raise RuntimeError("upstream down")
+
+    async def main():
+        batcher = TopicBatcher(generate_batch)
+        return await asyncio.gather(batcher.submit("a"), batcher.submit("b"), return_exceptions=True)
+
+    assert all(isinstance(result, RuntimeError) for result in run(main()))
+
+
+def test_full_batch_flushes_before_the_window_closes():
+    async def generate(topic):
+        return topic
+
+    async def main():
+        batcher = TopicBatcher(each(generate), window_ms=10_000, max_batch=2)
+        return await asyncio.wait_for(asyncio.gather(batcher.submit("a"), batcher.submit("b")), timeout=1)
+
+    assert run(main()) == ["a", "b"]
+
+
+def test_queue_cap_rejects_extra_callers():
+    async def generate(topic):
+        return topic
+
+    async def main():
+        batcher = TopicBatcher(each(generate), window_ms=10, max_pending=2)
+        waiting = [asyncio.ensure_future(batcher.submit(str(n))) for n in range(2)]
+        await asyncio.sleep(0)
+        with pytest.raises(BatchQueueFull):
+            await batcher.submit("overflow")
+        return await asyncio.gather(*waiting)
+
+    assert run(main()) == ["0", "1"]
+
+
+def test_content_batch_returns_one_result_per_topic():
+    results = run(generate_professional_content_batch(["AI in Healthcare", "Team culture"]))
+    assert [result["text"].splitlines()[0] for result in results] == [
+        "🚀 The Future of AI in AI in Healthcare",
+        "👥 Leadership Lessons from Team culture",
+    ]
@@ -7,7 +7,7 @@ for /f "tokens=5" %%a in ('netstat -ano ^| findstr ":8000"') do taskkill /PID %%
 for /f "tokens=5" %%a in ('netstat -ano ^| findstr ":8080"') do taskkill /PID %%a /F >nul 2>&1
 echo.
 echo Starting Backend Server (FastAPI)...
-start "InfluenceOS Backend" cmd /k "cd Backend && python working_server.py"
+start "InfluenceOS Backend" cmd /k "cd Backend && set DEV=1&& python working_server.py"
 echo.
 echo Starting Frontend Development Server (React + Vite)...
 start "InfluenceOS Frontend" cmd /k "cd Frontend && npm run dev"
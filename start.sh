@@ -13,7 +13,7 @@ echo ""
 # Start Backend Server
 echo "🔧 Starting Backend Server (FastAPI)..."
 cd Backend
-python3 working_server.py &
+DEV=1 python3 working_server.py &
 BACKEND_PID=$!
 cd ..
 echo ""